@@ -9,11 +9,14 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Collection,
+    Dict,
     Iterable,
     List,
     Mapping,
     MutableMapping,
     Optional,
+    Sequence,
+    Type,
     cast,
 )
 
@@ -104,6 +107,11 @@ class _BatchedCSTVisitor(CSTVisitor):
     before_visit: Optional[VisitorMethod]
     after_leave: Optional[VisitorMethod]
 
+    # Per node type caches of the methods to call, so that each node visit is a
+    # single dict lookup instead of building a method name and looking it up.
+    _visit_methods_by_type: Dict[Type["CSTNode"], Sequence[VisitorMethod]]
+    _leave_methods_by_type: Dict[Type["CSTNode"], Sequence[VisitorMethod]]
+
     def __init__(
         self,
         visitor_methods: _VisitorMethodCollection,
@@ -115,6 +123,21 @@ class _BatchedCSTVisitor(CSTVisitor):
         self.visitor_methods = visitor_methods
         self.before_visit = before_visit
         self.after_leave = after_leave
+        self._visit_methods_by_type = {}
+        self._leave_methods_by_type = {}
+
+    def _cache_methods(
+        self,
+        cache: Dict[Type["CSTNode"], Sequence[VisitorMethod]],
+        prefix: str,
+        node_type: Type["CSTNode"],
+    ) -> Sequence[VisitorMethod]:
+        """
+        Looks up the methods to call for [node_type] and stores them in [cache].
+        """
+        methods = self.visitor_methods.get(f"{prefix}{node_type.__name__}", ())
+        cache[node_type] = methods
+        return methods
 
     def on_visit(self, node: "CSTNode") -> bool:
         """
@@ -122,8 +145,12 @@ class _BatchedCSTVisitor(CSTVisitor):
         """
         if self.before_visit is not None:
             self.before_visit(node)
-        type_name = type(node).__name__
-        for v in self.visitor_methods.get(f"visit_{type_name}", []):
+        methods = self._visit_methods_by_type.get(type(node))
+        if methods is None:
+            methods = self._cache_methods(
+                self._visit_methods_by_type, "visit_", type(node)
+            )
+        for v in methods:
             v(node)
         return True
 
@@ -131,8 +158,12 @@ class _BatchedCSTVisitor(CSTVisitor):
         """
         Call appropriate leave methods on node after visiting children.
         """
-        type_name = type(original_node).__name__
-        for v in self.visitor_methods.get(f"leave_{type_name}", []):
+        methods = self._leave_methods_by_type.get(type(original_node))
+        if methods is None:
+            methods = self._cache_methods(
+                self._leave_methods_by_type, "leave_", type(original_node)
+            )
+        for v in methods:
             v(original_node)
         if self.after_leave is not None:
             self.after_leave(original_node)
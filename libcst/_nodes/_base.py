@@ -17,7 +17,7 @@ from typing import (
     cast,
 )
 
-from libcst._nodes._internal import CodegenState, CodePosition, CodeRange
+from libcst._nodes._internal import CodegenState
 from libcst._removal_sentinel import RemovalSentinel
 from libcst._type_enforce import is_value_of_type
 from libcst._visitors import CSTTransformer, CSTVisitor, CSTVisitorT
@@ -75,6 +75,11 @@ def _indent(value: str) -> str:
 
 @dataclass(frozen=True)
 class CSTNode(ABC):
+    # Keep nodes weak-referenceable. On Python 3.6 abc.ABC isn't slotted, so nodes
+    # already get __dict__ and __weakref__ from it, and redeclaring __weakref__ here
+    # would be an error.
+    __slots__ = ("__weakref__",) if "__slots__" in ABC.__dict__ else ()
+
     def __post_init__(self) -> None:
         # PERF: It might make more sense to move validation work into the visitor, which
         # would allow us to avoid validating the tree when parsing a file.
@@ -260,10 +265,12 @@ class CSTNode(ABC):
         ...
 
     def _codegen(self, state: CodegenState, **kwargs: Any) -> None:
-        start = CodePosition(state.line, state.column)
+        # Keep the start position as plain ints. CodePosition/CodeRange objects are
+        # only built if the state actually records a position for this node.
+        start_line = state.line
+        start_column = state.column
         self._codegen_impl(state, **kwargs)
-        end = CodePosition(state.line, state.column)
-        state.record_position(self, CodeRange(start, end))
+        state.record_position(self, start_line, start_column)
 
     def with_changes(self: _CSTNodeSelfT, **changes: Any) -> _CSTNodeSelfT:
         """
@@ -316,23 +323,22 @@ class CSTNode(ABC):
 
         return deep_equals_impl(self, other)
 
-    def __eq__(self: _CSTNodeSelfT, other: _CSTNodeSelfT) -> bool:
-        """
-        CSTNodes are only treated as equal by identity. This matches the behavior of
-        CPython's AST nodes.
-
-        If you actually want to compare the value instead of the identity of the current
-        node with another, use `node.deep_equals`. Because `deep_equals` must traverse
-        the entire tree, it can have an unexpectedly large time complexity.
-
-        We're not exposing value equality as the default behavior because of
-        `deep_equals`'s large time complexity.
-        """
-        return self is other
-
-    def __hash__(self) -> int:
-        # Equality of nodes is based on identity, so the hash should be too.
-        return id(self)
+    # CSTNodes are only treated as equal by identity. This matches the behavior of
+    # CPython's AST nodes.
+    #
+    # If you actually want to compare the value instead of the identity of the current
+    # node with another, use `node.deep_equals`. Because `deep_equals` must traverse
+    # the entire tree, it can have an unexpectedly large time complexity.
+    #
+    # We're not exposing value equality as the default behavior because of
+    # `deep_equals`'s large time complexity.
+    #
+    # Equality of nodes is based on identity, so the hash should be too. We reuse
+    # object's C implementations rather than defining Python methods, because nodes
+    # are used as dict keys everywhere (e.g. metadata) and a Python-level
+    # `__hash__`/`__eq__` costs a full method call on every lookup.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
 
     def __repr__(self) -> str:
         if len(fields(self)) == 0:
@@ -350,6 +356,8 @@ class CSTNode(ABC):
 
 
 class BaseLeaf(CSTNode, ABC):
+    __slots__ = ()
+
     @property
     def children(self) -> Sequence[CSTNode]:
         # override this with an optimized implementation
@@ -369,6 +377,8 @@ class BaseValueToken(BaseLeaf, ABC):
     into the parent CSTNode, and hard-coded into the implementation of _codegen.
     """
 
+    __slots__ = ()
+
     value: str
 
     def _codegen_impl(self, state: CodegenState) -> None:
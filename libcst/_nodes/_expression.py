@@ -222,6 +222,8 @@ class _BaseParenthesizedNode(CSTNode, ABC):
     this to get that functionality.
     """
 
+    __slots__ = ()
+
     lpar: Sequence[LeftParen] = ()
     # Sequence of parenthesis for precedence dictation.
     rpar: Sequence[RightParen] = ()
@@ -254,6 +256,8 @@ class BaseExpression(_BaseParenthesizedNode, ABC):
     An base class for all expressions. :class:`BaseExpression` contains no fields.
     """
 
+    __slots__ = ()
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         """
         Returns true if this expression is safe to be use with a word operator
@@ -284,7 +288,7 @@ class BaseAssignTargetExpression(BaseExpression, ABC):
     <https://github.com/python/cpython/blob/v3.8.0a4/Python/ast.c#L1120>`_.
     """
 
-    pass
+    __slots__ = ()
 
 
 class BaseDelTargetExpression(BaseExpression, ABC):
@@ -304,7 +308,7 @@ class BaseDelTargetExpression(BaseExpression, ABC):
     <https://github.com/python/cpython/blob/v3.8.0a4/Python/compile.c#L4854>`_.
     """
 
-    pass
+    __slots__ = ()
 
 
 @add_slots
@@ -378,6 +382,8 @@ class BaseNumber(BaseExpression, ABC):
     used anywhere that you need to explicitly take any number type.
     """
 
+    __slots__ = ()
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         """
         Numbers are funny. The expression "5in [1,2,3,4,5]" is a valid expression
@@ -498,10 +504,12 @@ class BaseString(BaseExpression, ABC):
     :class:`SimpleString`, :class:`ConcatenatedString`, and :class:`FormattedString`.
     """
 
-    pass
+    __slots__ = ()
 
 
 class _BasePrefixedString(BaseString, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def _get_prefix(self) -> str:
         ...
@@ -599,7 +607,7 @@ class BaseFormattedStringContent(CSTNode, ABC):
     sequence of :class:`BaseFormattedStringContent` parts.
     """
 
-    pass
+    __slots__ = ()
 
 
 @add_slots
@@ -1927,6 +1935,8 @@ class _BaseExpressionWithArgs(BaseExpression, ABC):
     in typing. So, we have common validation functions here.
     """
 
+    __slots__ = ()
+
     #: Sequence of arguments that will be passed to the function call.
     args: Sequence[Arg] = ()
 
@@ -2364,6 +2374,8 @@ class _BaseElementImpl(CSTNode, ABC):
     An internal base class for :class:`Element` and :class:`DictElement`.
     """
 
+    __slots__ = ()
+
     # pyre-fixme[13]: Attribute `value` is never initialized.
     value: BaseExpression
     comma: Union[Comma, MaybeSentinel] = MaybeSentinel.DEFAULT
@@ -2402,6 +2414,8 @@ class BaseElement(_BaseElementImpl, ABC):
     BaseDictElement.
     """
 
+    __slots__ = ()
+
 
 class BaseDictElement(_BaseElementImpl, ABC):
     """
@@ -2409,6 +2423,8 @@ class BaseDictElement(_BaseElementImpl, ABC):
     BaseElement.
     """
 
+    __slots__ = ()
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -2691,6 +2707,8 @@ class BaseList(BaseExpression, ABC):
     object when evaluated.
     """
 
+    __slots__ = ()
+
     lbracket: LeftSquareBracket = LeftSquareBracket()
     #: Brackets surrounding the list.
     rbracket: RightSquareBracket = RightSquareBracket()
@@ -2771,6 +2789,8 @@ class _BaseSetOrDict(BaseExpression, ABC):
     shouldn't be exported.
     """
 
+    __slots__ = ()
+
     lbrace: LeftCurlyBrace = LeftCurlyBrace()
     #: Braces surrounding the set or dict.
     rbrace: RightCurlyBrace = RightCurlyBrace()
@@ -2796,6 +2816,8 @@ class BaseSet(_BaseSetOrDict, ABC):
     a set object when evaluated.
     """
 
+    __slots__ = ()
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -2865,6 +2887,8 @@ class BaseDict(_BaseSetOrDict, ABC):
     a dict object when evaluated.
     """
 
+    __slots__ = ()
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -3137,6 +3161,8 @@ class BaseComp(BaseExpression, ABC):
     :class:`GeneratorExp`, :class:`ListComp`, :class:`SetComp`, and :class:`DictComp`.
     """
 
+    __slots__ = ()
+
     # pyre-fixme[13]: Attribute `for_in` is never initialized.
     for_in: CompFor
 
@@ -3148,6 +3174,8 @@ class BaseSimpleComp(BaseComp, ABC):
     ``value``.
     """
 
+    __slots__ = ()
+
     #: The expression evaluated during each iteration of the comprehension. This
     #: lexically comes before the ``for_in`` clause, but it is semantically the
     #: inner-most element, evaluated inside the ``for_in`` clause.
@@ -88,7 +88,13 @@ class CodegenState:
     def add_token(self, value: str) -> None:
         self.tokens.append(value)
 
-    def record_position(self, node: _CSTNodeT, position: CodeRange) -> None:
+    def record_position(
+        self, node: _CSTNodeT, start_line: int, start_column: int
+    ) -> None:
+        """
+        Records the position of [node], spanning from the given start to the current
+        position.
+        """
         pass
 
     @contextmanager
@@ -123,20 +129,28 @@ class BasicCodegenState(CodegenState):
         """
         Computes new line and column numbers from adding the token [value].
         """
-        segments = NEWLINE_RE.split(value)
-        if len(segments) == 1:  # contains no newlines
+        if "\n" not in value and "\r" not in value:  # contains no newlines
+            # Most tokens take this path, so skip the regex split entirely.
             # no change to self.lines
             self.column += len(value)
-        else:
-            self.line += len(segments) - 1
-            # newline resets column back to 0, but a trailing token may shift column
-            self.column = len(segments[-1])
+            return
 
-    def record_position(self, node: _CSTNodeT, position: CodeRange) -> None:
+        segments = NEWLINE_RE.split(value)
+        self.line += len(segments) - 1
+        # newline resets column back to 0, but a trailing token may shift column
+        self.column = len(segments[-1])
+
+    def record_position(
+        self, node: _CSTNodeT, start_line: int, start_column: int
+    ) -> None:
+        computed = self.provider._computed
         # Don't overwrite existing position information
         # (i.e. semantic position has already been recorded)
-        if node not in self.provider._computed:
-            self.provider._computed[node] = position
+        if node not in computed:
+            computed[node] = CodeRange(
+                CodePosition(start_line, start_column),
+                CodePosition(self.line, self.column),
+            )
 
 
 class SyntacticCodegenState(BasicCodegenState):
@@ -152,21 +166,26 @@ class SyntacticCodegenState(BasicCodegenState):
         start_node: Optional[_CSTNodeT] = None,
         end_node: Optional[_CSTNodeT] = None,
     ) -> Iterator[None]:
-        start = CodePosition(self.line, self.column)
+        start_line = self.line
+        start_column = self.column
         try:
             yield
         finally:
-            end = CodePosition(self.line, self.column)
+            computed = self.provider._computed
 
             # Override with positions hoisted from child nodes if provided
             start = (
-                self.provider._computed[start_node].start
+                computed[start_node].start
                 if start_node is not None
-                else start
+                else CodePosition(start_line, start_column)
+            )
+            end = (
+                computed[end_node].end
+                if end_node is not None
+                else CodePosition(self.line, self.column)
             )
-            end = self.provider._computed[end_node].end if end_node is not None else end
 
-            self.provider._computed[node] = CodeRange(start, end)
+            computed[node] = CodeRange(start, end)
 
 
 def visit_required(
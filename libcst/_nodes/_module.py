@@ -140,6 +140,19 @@ class Module(CSTNode):
         metadata instead.
         """
 
+        state = self._get_codegen_state(provider)
+        node._codegen(state)
+
+        return "".join(state.tokens)
+
+    def _get_codegen_state(
+        self, provider: Optional["PositionProvider"] = None
+    ) -> CodegenState:
+        """
+        Creates the codegen state used to generate code for nodes in this module,
+        recording positions into [provider] if given.
+        """
+
         from libcst.metadata.position_provider import SyntacticPositionProvider
 
         if provider is None:
@@ -161,6 +174,4 @@ class Module(CSTNode):
                 provider=provider,
             )
 
-        node._codegen(state)
-
-        return "".join(state.tokens)
+        return state
@@ -20,6 +20,8 @@ class _BaseOneTokenOp(CSTNode, ABC):
     Any node that has a static value and needs to own whitespace on both sides.
     """
 
+    __slots__ = ()
+
     # pyre-fixme[13]: Uninitialized attribute
     whitespace_before: BaseParenthesizableWhitespace
 
@@ -53,6 +55,8 @@ class _BaseTwoTokenOp(CSTNode, ABC):
     in beteween them.
     """
 
+    __slots__ = ()
+
     # pyre-fixme[13]: Uninitialized attribute
     whitespace_before: BaseParenthesizableWhitespace
 
@@ -97,6 +101,8 @@ class BaseUnaryOp(CSTNode, ABC):
     Any node that has a static value used in a :class:`UnaryOperation` expression.
     """
 
+    __slots__ = ()
+
     #: Any space that appears directly after this operator.
     # pyre-fixme[13]: Uninitialized attribute
     whitespace_after: BaseParenthesizableWhitespace
@@ -123,6 +129,8 @@ class BaseBooleanOp(_BaseOneTokenOp, ABC):
     This node is purely for typing.
     """
 
+    __slots__ = ()
+
 
 class BaseBinaryOp(CSTNode, ABC):
     """
@@ -130,6 +138,8 @@ class BaseBinaryOp(CSTNode, ABC):
     This node is purely for typing.
     """
 
+    __slots__ = ()
+
 
 class BaseCompOp(CSTNode, ABC):
     """
@@ -137,6 +147,8 @@ class BaseCompOp(CSTNode, ABC):
     This node is purely for typing.
     """
 
+    __slots__ = ()
+
 
 class BaseAugOp(CSTNode, ABC):
     """
@@ -144,6 +156,8 @@ class BaseAugOp(CSTNode, ABC):
     This node is purely for typing.
     """
 
+    __slots__ = ()
+
 
 @add_slots
 @dataclass(frozen=True)
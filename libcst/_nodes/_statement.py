@@ -63,6 +63,8 @@ class BaseSuite(CSTNode, ABC):
         -- https://docs.python.org/3/reference/compound_stmts.html
     """
 
+    __slots__ = ()
+
     body: Union[
         Sequence[Union["SimpleStatementLine", "BaseCompoundStatement"]],
         Sequence["BaseSmallStatement"],
@@ -77,6 +79,8 @@ class BaseSmallStatement(CSTNode, ABC):
     simplify type definitions and isinstance checks.
     """
 
+    __slots__ = ()
+
     #: An optional semicolon that appears after a small statement. This is optional
     #: for the last small statement in a :class:`SimpleStatementLine` or
     #: :class:`SimpleStatementSuite`, but all other small statements inside a simple
@@ -342,6 +346,8 @@ class _BaseSimpleStatement(CSTNode, ABC):
     small statement.
     """
 
+    __slots__ = ()
+
     #: Sequence of small statements. All but the last statement are required to have
     #: a semicolon.
     body: Sequence[BaseSmallStatement]
@@ -522,6 +528,8 @@ class BaseCompoundStatement(CSTNode, ABC):
         -- https://docs.python.org/3/reference/compound_stmts.html
     """
 
+    __slots__ = ()
+
     #: The body of this compound statement.
     body: BaseSuite
 
@@ -5,6 +5,7 @@
 
 # pyre-strict
 import dataclasses
+import functools
 from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Type, TypeVar
@@ -31,6 +32,16 @@ class _NOOPVisitor(CSTTransformer):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cached(code: str) -> cst.Module:
+    """
+    Parses ``code`` once and returns the same module for every later call with the
+    same source. CST nodes are immutable, so sharing the parsed tree between tests is
+    safe.
+    """
+    return cst.parse_module(code)
+
+
 def _cst_node_equality_func(
     a: cst.CSTNode, b: cst.CSTNode, msg: Optional[str] = None
 ) -> None:
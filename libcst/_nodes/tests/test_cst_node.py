@@ -4,6 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+import weakref
 from textwrap import dedent
 from typing import TypeVar, Union
 
@@ -88,6 +89,21 @@ class CSTNodeTest(UnitTest):
         self.assertEqual(hash(sw1), hash(sw1))
         self.assertEqual(hash(sw2), hash(sw2))
 
+    def test_slots(self) -> None:
+        # Every libcst class in a node's MRO should declare __slots__. We don't check
+        # for a missing __dict__ directly, because on Python 3.6 abc.ABC isn't
+        # slotted, so nodes always have a __dict__ there.
+        module = cst.parse_module("def foo(a):\n    return [a.b + 1]\n")
+        for node in (module, module.body[0], cst.SimpleWhitespace("")):
+            for cls in type(node).__mro__:
+                if cls.__module__.startswith("libcst."):
+                    self.assertIn("__slots__", cls.__dict__, cls.__qualname__)
+
+    def test_weakref(self) -> None:
+        module = cst.parse_module("x = 1\n")
+        for node in (module, module.body[0], cst.Name("x")):
+            self.assertIs(weakref.ref(node)(), node)
+
     @data_provider(
         {
             "simple": (cst.SimpleWhitespace(""), cst.SimpleWhitespace("")),
@@ -7,12 +7,7 @@
 from typing import Tuple
 
 import libcst as cst
-from libcst._nodes._internal import (
-    BasicCodegenState,
-    CodePosition,
-    CodeRange,
-    SyntacticCodegenState,
-)
+from libcst._nodes._internal import BasicCodegenState, CodeRange, SyntacticCodegenState
 from libcst.metadata.position_provider import (
     BasicPositionProvider,
     SyntacticPositionProvider,
@@ -66,13 +61,12 @@ class InternalTest(UnitTest):
         # simulate codegen behavior for the dummy node
         # generates the code " pass "
         state = BasicCodegenState(" " * 4, "\n", BasicPositionProvider())
-        start = CodePosition(state.line, state.column)
+        start_line, start_column = position(state)
         state.add_token(" ")
         with state.record_syntactic_position(node):
             state.add_token("pass")
         state.add_token(" ")
-        end = CodePosition(state.line, state.column)
-        state.record_position(node, CodeRange(start, end))
+        state.record_position(node, start_line, start_column)
 
         # check whitespace is correctly recorded
         self.assertEqual(
@@ -86,13 +80,12 @@ class InternalTest(UnitTest):
         # simulate codegen behavior for the dummy node
         # generates the code " pass "
         state = SyntacticCodegenState(" " * 4, "\n", SyntacticPositionProvider())
-        start = CodePosition(state.line, state.column)
+        start_line, start_column = position(state)
         state.add_token(" ")
         with state.record_syntactic_position(node):
             state.add_token("pass")
         state.add_token(" ")
-        end = CodePosition(state.line, state.column)
-        state.record_position(node, CodeRange(start, end))
+        state.record_position(node, start_line, start_column)
 
         # check syntactic position ignores whitespace
         self.assertEqual(
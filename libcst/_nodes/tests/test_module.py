@@ -7,8 +7,8 @@
 from typing import Tuple, cast
 
 import libcst as cst
-from libcst import CodeRange, parse_module
-from libcst._nodes.tests.base import CSTNodeTest
+from libcst import CodeRange
+from libcst._nodes.tests.base import CSTNodeTest, _parse_cached
 from libcst.metadata.position_provider import SyntacticPositionProvider
 from libcst.testing.utils import data_provider
 
@@ -114,7 +114,7 @@ class ModuleTest(CSTNodeTest):
         }
     )
     def test_parser(self, *, code: str, expected: cst.Module) -> None:
-        self.assertEqual(parse_module(code), expected)
+        self.assertEqual(_parse_cached(code), expected)
 
     @data_provider(
         {
@@ -138,9 +138,9 @@ class ModuleTest(CSTNodeTest):
         }
     )
     def test_module_position(self, *, code: str, expected: CodeRange) -> None:
-        module = parse_module(code)
+        module = _parse_cached(code)
         provider = SyntacticPositionProvider()
-        module.code_for_node(module, provider)
+        provider._gen_impl(module)
 
         self.assertEqual(provider._computed[module], expected)
 
@@ -150,9 +150,9 @@ class ModuleTest(CSTNodeTest):
         self.assertEqual(actual, CodeRange.create(start, end))
 
     def test_function_position(self) -> None:
-        module = parse_module("def foo():\n    pass")
+        module = _parse_cached("def foo():\n    pass")
         provider = SyntacticPositionProvider()
-        module.code_for_node(module, provider)
+        provider._gen_impl(module)
 
         fn = cast(cst.FunctionDef, module.body[0])
         stmt = cast(cst.SimpleStatementLine, fn.body.body[0])
@@ -161,11 +161,11 @@ class ModuleTest(CSTNodeTest):
         self.cmp_position(provider._computed[pass_stmt], (2, 4), (2, 8))
 
     def test_nested_indent_position(self) -> None:
-        module = parse_module(
+        module = _parse_cached(
             "if True:\n    if False:\n        x = 1\nelse:\n    return"
         )
         provider = SyntacticPositionProvider()
-        module.code_for_node(module, provider)
+        provider._gen_impl(module)
 
         outer_if = cast(cst.If, module.body[0])
         inner_if = cast(cst.If, outer_if.body.body[0])
@@ -181,9 +181,9 @@ class ModuleTest(CSTNodeTest):
         self.cmp_position(provider._computed[return_stmt], (5, 4), (5, 10))
 
     def test_multiline_string_position(self) -> None:
-        module = parse_module('"abc"\\\n"def"')
+        module = _parse_cached('"abc"\\\n"def"')
         provider = SyntacticPositionProvider()
-        module.code_for_node(module, provider)
+        provider._gen_impl(module)
 
         stmt = cast(cst.SimpleStatementLine, module.body[0])
         expr = cast(cst.Expr, stmt.body[0])
@@ -51,9 +51,12 @@ def _resolve_impl(wrapper: "MetadataWrapper", providers: Collection[ProviderT])
                     wrapper._metadata[P] = P()._gen(wrapper)
                     completed.add(P)
 
-        metadata_batch = _gen_batchable(wrapper, [p() for p in batchable])
-        wrapper._metadata.update(metadata_batch)
-        completed |= batchable
+        # Skip the batched pass when nothing is batchable, since it would still
+        # walk the entire module without any visitors
+        if len(batchable) > 0:
+            metadata_batch = _gen_batchable(wrapper, [p() for p in batchable])
+            wrapper._metadata.update(metadata_batch)
+            completed |= batchable
 
         if len(completed) == 0 and len(batchable) == 0:
             # remaining must be non-empty at this point
@@ -8,10 +8,11 @@ from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Generic,
     Iterable,
     Mapping,
-    MutableMapping,
     Type,
     TypeVar,
     cast,
@@ -43,11 +44,16 @@ class BaseMetadataProvider(_MetadataDependent, Generic[_T]):
     """
 
     # Cache of metadata computed by this provider
-    _computed: MutableMapping["CSTNode", _T]
+    _computed: Dict["CSTNode", _T]
+
+    # Bound __setitem__ of _computed, for hot loops that want to skip the
+    # set_metadata method call. Rebound whenever _computed is replaced.
+    _set: Callable[["CSTNode", _T], None]
 
     def __init__(self) -> None:
         super().__init__()
         self._computed = {}
+        self._set = self._computed.__setitem__
 
     def _gen(self, wrapper: "MetadataWrapper") -> Mapping["CSTNode", _T]:
         """
@@ -56,13 +62,22 @@ class BaseMetadataProvider(_MetadataDependent, Generic[_T]):
         This is a hook for metadata resolver and should not be called directly.
         """
 
-        self._computed = {}
         # Resolve metadata dependencies for this provider
         with self.resolve(wrapper):
             self._gen_impl(wrapper.module)
 
-        # Copy into a mapping proxy to ensure immutability
-        return MappingProxyType(dict(self._computed))
+        # Wrap in a mapping proxy to ensure immutability without copying
+        return MappingProxyType(self._detach_computed())
+
+    def _detach_computed(self) -> Dict["CSTNode", _T]:
+        """
+        Returns the metadata computed so far and starts this provider over with an
+        empty mapping, so later runs never mutate a previously returned result.
+        """
+        computed = self._computed
+        self._computed = {}
+        self._set = self._computed.__setitem__
+        return computed
 
     def _gen_impl(self, module: "Module") -> None:
         """
@@ -73,6 +88,9 @@ class BaseMetadataProvider(_MetadataDependent, Generic[_T]):
     def set_metadata(self, node: "CSTNode", value: _T) -> None:
         """
         Map a given node to a metadata value.
+
+        Providers that set metadata on every node may call ``self._set`` instead
+        to avoid the overhead of a Python method call per node.
         """
         self._computed[node] = value
 
@@ -125,8 +143,10 @@ def _gen_batchable(
     Returns map of metadata mappings from the given batchable providers on 
     wrapper.
     """
+    # providers is iterated more than once, so materialize one-shot iterables
+    providers = list(providers)
     wrapper.visit_batched(providers)
 
     # Make immutable metadata mapping
     # pyre-ignore[7]
-    return {type(p): MappingProxyType(dict(p._computed)) for p in providers}
+    return {type(p): MappingProxyType(p._detach_computed()) for p in providers}
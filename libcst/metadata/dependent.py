@@ -88,7 +88,9 @@ class _MetadataDependent:
         this vistor. Metadata is accessible if [key] is the same as [cls] or
         if [key] is in METADATA_DEPENDENCIES.
         """
-        if key not in self.get_inherited_dependencies():
+        # self.metadata only ever holds declared dependencies, so the more expensive
+        # dependency check is only needed when the lookup would fail anyway
+        if key not in self.metadata and key not in self.get_inherited_dependencies():
             raise KeyError(
                 f"{key.__name__} is not declared as a dependency from {type(self).__name__}"
             )
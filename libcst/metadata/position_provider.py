@@ -22,7 +22,9 @@ class BasicPositionProvider(BaseMetadataProvider[CodeRange]):
     """
 
     def _gen_impl(self, module: _ModuleT) -> None:
-        module.code_for_node(module, provider=self)
+        # Positions are recorded as a side-effect of codegen, so skip joining the
+        # generated tokens into a string that would just be thrown away.
+        module._codegen(module._get_codegen_state(provider=self))
 
 
 class SyntacticPositionProvider(BasicPositionProvider):
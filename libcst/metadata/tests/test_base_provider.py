@@ -4,6 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+import weakref
 from typing import cast
 
 import libcst as cst
@@ -19,6 +20,8 @@ from libcst.testing.utils import UnitTest
 
 class BaseMetadataProviderTest(UnitTest):
     def test_visitor_provider(self) -> None:
+        test = self
+
         class SimpleProvider(VisitorMetadataProvider[int]):
             """
             Sets metadata on every node to 1.
@@ -26,6 +29,8 @@ class BaseMetadataProviderTest(UnitTest):
 
             def on_visit(self, node: cst.CSTNode) -> bool:
                 self.set_metadata(node, 1)
+                # Check access on provider while computing
+                test.assertEqual(self.get_metadata(SimpleProvider, node), 1)
                 return True
 
         wrapper = MetadataWrapper(parse_module("pass; return"))
@@ -36,10 +41,8 @@ class BaseMetadataProviderTest(UnitTest):
         provider = SimpleProvider()
         metadata = provider._gen(wrapper)
 
-        # Check access on provider
-        self.assertEqual(provider.get_metadata(SimpleProvider, module), 1)
-        self.assertEqual(provider.get_metadata(SimpleProvider, pass_), 1)
-        self.assertEqual(provider.get_metadata(SimpleProvider, return_), 1)
+        # Check the computed metadata was handed off to the returned mapping
+        self.assertEqual(provider._computed, {})
 
         # Check returned mapping
         self.assertEqual(metadata[module], 1)
@@ -47,6 +50,8 @@ class BaseMetadataProviderTest(UnitTest):
         self.assertEqual(metadata[return_], 1)
 
     def test_batchable_provider(self) -> None:
+        test = self
+
         class SimpleProvider(BatchableMetadataProvider[int]):
             """
             Sets metadata on every pass node to 1 and every return node to 2.
@@ -54,9 +59,12 @@ class BaseMetadataProviderTest(UnitTest):
 
             def visit_Pass(self, node: cst.Pass) -> None:
                 self.set_metadata(node, 1)
+                # Check access on provider while computing
+                test.assertEqual(self.get_metadata(SimpleProvider, node), 1)
 
             def visit_Return(self, node: cst.Return) -> None:
                 self.set_metadata(node, 2)
+                test.assertEqual(self.get_metadata(SimpleProvider, node), 2)
 
         wrapper = MetadataWrapper(parse_module("pass; return; pass"))
         module = wrapper.module
@@ -67,12 +75,89 @@ class BaseMetadataProviderTest(UnitTest):
         provider = SimpleProvider()
         metadata = _gen_batchable(wrapper, [provider])
 
-        # Check access on provider
-        self.assertEqual(provider.get_metadata(SimpleProvider, pass_), 1)
-        self.assertEqual(provider.get_metadata(SimpleProvider, return_), 2)
-        self.assertEqual(provider.get_metadata(SimpleProvider, pass_2), 1)
+        # Check the computed metadata was handed off to the returned mapping
+        self.assertEqual(provider._computed, {})
 
         # Check returned mapping
         self.assertEqual(metadata[SimpleProvider][pass_], 1)
         self.assertEqual(metadata[SimpleProvider][return_], 2)
         self.assertEqual(metadata[SimpleProvider][pass_2], 1)
+
+    def test_batchable_provider_reuse(self) -> None:
+        class SimpleProvider(BatchableMetadataProvider[int]):
+            """
+            Sets metadata on every pass node to 1.
+            """
+
+            def visit_Pass(self, node: cst.Pass) -> None:
+                self.set_metadata(node, 1)
+
+        provider = SimpleProvider()
+        first = _gen_batchable(MetadataWrapper(parse_module("pass")), [provider])
+        second = _gen_batchable(
+            MetadataWrapper(parse_module("pass; pass")), [provider]
+        )
+
+        # Reusing a provider must not mutate a previously returned mapping
+        self.assertEqual(len(first[SimpleProvider]), 1)
+        self.assertEqual(len(second[SimpleProvider]), 2)
+
+    def test_batchable_provider_iterator(self) -> None:
+        class SimpleProvider(BatchableMetadataProvider[int]):
+            """
+            Sets metadata on every pass node to 1.
+            """
+
+            def visit_Pass(self, node: cst.Pass) -> None:
+                self.set_metadata(node, 1)
+
+        wrapper = MetadataWrapper(parse_module("pass"))
+        module = wrapper.module
+        pass_ = cast(cst.SimpleStatementLine, module.body[0]).body[0]
+
+        # A one-shot iterable of providers should be fully resolved
+        metadata = _gen_batchable(wrapper, iter([SimpleProvider()]))
+
+        self.assertEqual(metadata[SimpleProvider][pass_], 1)
+
+    def test_visitor_provider_fast_set(self) -> None:
+        runs = [0]
+
+        class SimpleProvider(VisitorMetadataProvider[int]):
+            """
+            Sets metadata on every node to the current run number through the fast
+            setter.
+            """
+
+            def _gen_impl(self, module: cst.Module) -> None:
+                runs[0] += 1
+                super()._gen_impl(module)
+
+            def on_visit(self, node: cst.CSTNode) -> bool:
+                self._set(node, runs[0])
+                return True
+
+        wrapper = MetadataWrapper(parse_module("pass"))
+        module = wrapper.module
+
+        provider = SimpleProvider()
+        first = provider._gen(wrapper)
+        second = provider._gen(wrapper)
+
+        # Each run should write into its own mapping, leaving earlier results intact
+        self.assertIsNot(first, second)
+        self.assertEqual(first[module], 1)
+        self.assertEqual(second[module], 2)
+
+    def test_provider_layout(self) -> None:
+        class Slotted:
+            __slots__ = ("value",)
+
+        class SimpleProvider(Slotted, VisitorMetadataProvider[int]):
+            pass
+
+        # Providers can be combined with slotted classes without a layout conflict
+        provider = SimpleProvider()
+        provider.value = 1
+        # Providers are weak-referenceable
+        self.assertIs(weakref.ref(provider)(), provider)
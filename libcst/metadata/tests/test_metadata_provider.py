@@ -4,7 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import libcst as cst
 from libcst import parse_module
@@ -344,3 +344,19 @@ class MetadataProviderTest(UnitTest):
             MetadataException, "Detected circular dependencies in ProviderA"
         ):
             MetadataWrapper(cst.Module([])).visit(BadVisitor())
+
+    def test_no_batched_pass_without_batchable(self) -> None:
+        """
+        Tests that resolving only non-batchable providers doesn't run an empty
+        batched visit over the module.
+        """
+
+        class SimpleProvider(VisitorMetadataProvider[int]):
+            def visit_Pass(self, node: cst.Pass) -> None:
+                self.set_metadata(node, 1)
+
+        wrapper = MetadataWrapper(parse_module("pass"))
+        with patch("libcst.metadata._resolver._gen_batchable") as gen_batchable:
+            wrapper.resolve(SimpleProvider)
+
+        gen_batchable.assert_not_called()